@@ -24,16 +24,14 @@ import datetime
 import base64
 import webbrowser
 import tempfile
-import copy
 
-import pandas as pd
-from pandas.io.json import json_normalize
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from typing import Dict, Any
+import numpy as np
+
+from typing import Dict, Any, List, Optional, Tuple, Union, TYPE_CHECKING
 from pathlib import Path
 
-from prometheus_api_client import Metric, MetricsList, PrometheusConnect
-from prometheus_api_client.utils import parse_datetime, parse_timedelta
 from prometheus_client import push_to_gateway
 
 from email.mime.multipart import MIMEMultipart
@@ -43,8 +41,13 @@ from thoth.slo_reporter.sli_report import SLIReport
 from thoth.slo_reporter import __service_version__
 from thoth.slo_reporter.configuration import Configuration
 from thoth.slo_reporter.utils import manipulate_retrieved_metrics_vector
-from thoth.slo_reporter.utils import store_thoth_sli_on_ceph, connect_to_ceph
+from thoth.slo_reporter.utils import store_thoth_sli_on_ceph, connect_to_ceph, connect_to_thanos
 
+if TYPE_CHECKING:
+    # pandas and prometheus_api_client (which pulls in pandas) are imported lazily where needed.
+    import pandas as pd
+    from prometheus_api_client import Metric, PrometheusConnect
+    from thoth.storages import CephStore
 
 _LOGGER = logging.getLogger("thoth.slo_reporter")
 _LOGGER.info(f"Thoth SLO Reporter v%s", __service_version__)
@@ -52,6 +55,7 @@ _LOGGER.info(f"Thoth SLO Reporter v%s", __service_version__)
 _DRY_RUN = bool(int(os.getenv("DRY_RUN", 0)))
 _ONLY_STORE_ON_CEPH = bool(int(os.getenv("THOTH_ONLY_STORE_ON_CEPH", 0)))
 _DEBUG_LEVEL = bool(int(os.getenv("DEBUG_LEVEL", 0)))
+_MAX_QUERY_WORKERS = int(os.getenv("THOTH_SLO_REPORTER_MAX_QUERY_WORKERS", 16))
 
 if _DEBUG_LEVEL:
     logging.basicConfig(level=logging.DEBUG)
@@ -59,16 +63,45 @@ else:
     logging.basicConfig(level=logging.INFO)
 
 
-def collect_metrics(configuration: Configuration, sli_report: SLIReport):
-    """Collect metrics from Prometheus/Thanos."""
-    if not _DRY_RUN:
-        pc = PrometheusConnect(
-            url=configuration.thanos_url,
-            headers={"Authorization": f"bearer {configuration.thanos_token}"},
-            disable_ssl=True,
+def _query_metric(
+    pc: "PrometheusConnect",
+    configuration: Configuration,
+    query_name: str,
+    query: str,
+    requires_range: bool,
+    action_type: Optional[str],
+) -> Union[float, str]:
+    """Run a single query against Prometheus/Thanos and manipulate the result."""
+    _LOGGER.info(f"Querying... {query_name}")
+    _LOGGER.info(f"Using query... {query}")
+
+    if _DRY_RUN:
+        metric_data = [{"metric": "dry run", "value": [datetime.datetime.utcnow(), 0]}]
+        return float(metric_data[0]["value"][1])
+
+    if requires_range:
+        metric_data = pc.custom_query_range(
+            query=query, start_time=configuration.start_time, end_time=configuration.end_time, step=configuration.step,
         )
 
+    else:
+        metric_data = pc.custom_query(query=query)
+
+    _LOGGER.debug("Metric obtained... %s", metric_data)
+
+    if requires_range:
+        values = metric_data[0]["values"]
+        metrics_vector = np.fromiter((v[1] for v in values), dtype=np.float64, count=len(values))
+        metrics_vector = metrics_vector[metrics_vector > 0]
+        return manipulate_retrieved_metrics_vector(metrics_vector=metrics_vector, action=action_type)
+
+    return float(metric_data[0]["value"][1])
+
+
+def collect_metrics(configuration: Configuration, sli_report: SLIReport, pc: Optional["PrometheusConnect"] = None):
+    """Collect metrics from Prometheus/Thanos."""
     collected_info = {}
+    tasks = []
 
     for sli_name, sli_methods in sli_report.report_sli_context.items():
         _LOGGER.info(f"Retrieving data for... {sli_name}")
@@ -77,6 +110,7 @@ def collect_metrics(configuration: Configuration, sli_report: SLIReport):
         for query_name, query_inputs in sli_methods["query"].items():
 
             requires_range = False
+            action_type = None
 
             if isinstance(query_inputs, dict):
                 query = query_inputs["query"]
@@ -85,53 +119,56 @@ def collect_metrics(configuration: Configuration, sli_report: SLIReport):
             else:
                 query = query_inputs
 
-            _LOGGER.info(f"Querying... {query_name}")
-            _LOGGER.info(f"Using query... {query}")
-
+            # Keep the order in which queries are defined, results are filled as they complete.
+            collected_info[sli_name][query_name] = None
+            tasks.append((sli_name, query_name, query, requires_range, action_type))
+
+    # Queries are I/O bound, run them concurrently.
+    with ThreadPoolExecutor(max_workers=_MAX_QUERY_WORKERS) as executor:
+        futures = {
+            executor.submit(
+                _query_metric,
+                pc=pc,
+                configuration=configuration,
+                query_name=query_name,
+                query=query,
+                requires_range=requires_range,
+                action_type=action_type,
+            ): (sli_name, query_name)
+            for sli_name, query_name, query, requires_range, action_type in tasks
+        }
+
+        for future in as_completed(futures):
+            sli_name, query_name = futures[future]
             try:
-                if not _DRY_RUN:
-
-                    if requires_range:
-                        metric_data = pc.custom_query_range(
-                            query=query,
-                            start_time=configuration.start_time,
-                            end_time=configuration.end_time,
-                            step=configuration.step,
-                        )
-
-                    else:
-                        metric_data = pc.custom_query(query=query)
-
-                    _LOGGER.info(f"Metric obtained... {metric_data}")
-
-                    if requires_range:
-                        metrics_vector = [float(v[1]) for v in metric_data[0]["values"] if float(v[1]) > 0]
-                        result = manipulate_retrieved_metrics_vector(metrics_vector=metrics_vector, action=action_type)
-
-                        collected_info[sli_name][query_name] = result
-
-                    else:
-                        collected_info[sli_name][query_name] = float(metric_data[0]["value"][1])
-
-                else:
-                    metric_data = [{"metric": "dry run", "value": [datetime.datetime.utcnow(), 0]}]
-                    result = float(metric_data[0]["value"][1])
-                    collected_info[sli_name][query_name] = result
-
+                collected_info[sli_name][query_name] = future.result()
             except Exception as e:
                 _LOGGER.exception(f"Could not gather metric for {sli_name}-{query_name}...{e}")
-                pass
                 collected_info[sli_name][query_name] = "ErrorMetricRetrieval"
 
     return collected_info
 
 
+def evaluate_metrics(sli_metrics: Dict[str, Any], sli_report: SLIReport) -> Dict[str, Dict[str, Any]]:
+    """Evaluate collected metrics once for each SLI, to be reused for storing and reporting."""
+    evaluated_metrics = {}
+
+    for sli_name, metric_data in sli_metrics.items():
+        evaluation_method = sli_report.report_sli_context[sli_name]["evaluation_method"]
+        evaluated_metrics[sli_name] = evaluation_method(metric_data)
+
+    return evaluated_metrics
+
+
 def store_sli_weekly_metrics_to_ceph(
-    weekly_metrics: Dict[str, Any], configuration: Configuration, sli_report: SLIReport,
+    evaluated_metrics: Dict[str, Dict[str, Any]], configuration: Configuration, sli_report: SLIReport,
 ):
     """Store weekly metrics to ceph."""
-    datetime = str(configuration.end_time.strftime("%Y-%m-%d"))
-    sli_metrics_id = f"sli-thoth-{datetime}"
+    # pandas is only needed here, import it lazily to keep startup fast.
+    import pandas as pd
+
+    date_str = configuration.end_time.strftime("%Y-%m-%d")
+    sli_metrics_id = f"sli-thoth-{date_str}"
     _LOGGER.info(f"Start storing Thoth weekly SLI metrics for {sli_metrics_id}.")
 
     ceph_sli = connect_to_ceph(
@@ -143,86 +180,95 @@ def store_sli_weekly_metrics_to_ceph(
         bucket=configuration.public_ceph_bucket,
     )
 
-    for metric_class in weekly_metrics:
+    uploads = []
+
+    for metric_class, total_ceph_sli in evaluated_metrics.items():
         metrics = {}
-        metrics["datetime"] = datetime
+        metrics["datetime"] = date_str
         metrics["timestamp"] = configuration.end_time_epoch
 
-        evaluation_method = sli_report.report_sli_context[metric_class]["evaluation_method"]
-        total_ceph_sli = evaluation_method(weekly_metrics[metric_class])
-
         for metric in total_ceph_sli:
             metrics[metric] = total_ceph_sli[metric]["value"]
 
-        metrics_df = pd.DataFrame(json_normalize(metrics))
+        # metrics is a flat dict, no need to normalize it.
+        metrics_df = pd.DataFrame([metrics])
         _LOGGER.info(f"Storing... \n{metrics_df}")
-        ceph_path = f"{metric_class}/{metric_class}-{datetime}.csv"
+        ceph_path = f"{metric_class}/{metric_class}-{date_str}.csv"
+        uploads.append((metric_class, metrics_df, ceph_path))
+
+    # Private and public bucket are independent, upload to them concurrently.
+    # CephStore (boto3 resource) is not thread-safe, so each bucket is handled by a single thread.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        executor.submit(_store_on_ceph_bucket, ceph_sli=ceph_sli, uploads=uploads, bucket_name="Thoth")
+        executor.submit(
+            _store_on_ceph_bucket, ceph_sli=public_ceph_sli, uploads=uploads, bucket_name="Public", is_public=True,
+        )
 
-        try:
-            store_thoth_sli_on_ceph(
-                ceph_sli=ceph_sli, metric_class=metric_class, metrics_df=metrics_df, ceph_path=ceph_path,
-            )
-        except Exception as e_ceph:
-            _LOGGER.exception(f"Could not store metrics on Thoth bucket on Ceph...{e_ceph}")
-            pass
 
+def _store_on_ceph_bucket(
+    ceph_sli: "CephStore", uploads: List[Tuple[str, "pd.DataFrame", str]], bucket_name: str, is_public: bool = False,
+) -> None:
+    """Store all metric classes on one Ceph bucket."""
+    for metric_class, metrics_df, ceph_path in uploads:
         try:
             store_thoth_sli_on_ceph(
-                ceph_sli=public_ceph_sli,
+                ceph_sli=ceph_sli,
                 metric_class=metric_class,
                 metrics_df=metrics_df,
                 ceph_path=ceph_path,
-                is_public=True,
+                is_public=is_public,
             )
         except Exception as e_ceph:
-            _LOGGER.exception(f"Could not store metrics on Public bucket on Ceph...{e_ceph}")
-            pass
+            _LOGGER.exception(f"Could not store metrics on {bucket_name} bucket on Ceph...{e_ceph}")
 
 
 def push_thoth_sli_weekly_metrics(
-    weekly_metrics: Dict[str, Metric], configuration: Configuration, sli_report: SLIReport,
+    weekly_metrics: Dict[str, "Metric"], configuration: Configuration, sli_report: SLIReport,
 ):
     """Push Thoth SLI weekly metric to PushGateway."""
+    samples = {}
+
     for sli_type, metric_data in weekly_metrics.items():
 
         for metric_name, weekly_value_metric in metric_data.items():
 
             if weekly_value_metric != "ErrorMetricRetrieval":
-
-                configuration.thoth_weekly_sli.labels(sli_type=sli_type, metric_name=metric_name).set(
-                    weekly_value_metric,
-                )
+                samples[(sli_type, metric_name)] = weekly_value_metric
                 _LOGGER.info("(sli_type=%r, metric_name=%r)=%r", sli_type, metric_name, weekly_value_metric)
 
+    configuration.thoth_weekly_sli.samples.update(samples)
+
     push_to_gateway(
         configuration.pushgateway_endpoint, job="Weekly Thoth SLI", registry=configuration.prometheus_registry,
     )
     _LOGGER.info(f"Pushed Thoth weekly SLI to Prometheus Pushgateway.")
 
 
-def generate_email(sli_metrics: Dict[str, Any], configuration: Configuration, sli_report: SLIReport):
+def generate_email(
+    evaluated_metrics: Dict[str, Dict[str, Any]], configuration: Configuration, sli_report: SLIReport,
+):
     """Generate email to be sent."""
-    message = sli_report.report_start
-    message += sli_report.report_style
-    message += sli_report.report_intro
+    message_parts = [sli_report.report_start, sli_report.report_style, sli_report.report_intro]
 
-    for sli_name, metric_data in sli_metrics.items():
+    for sli_name, html_inputs in evaluated_metrics.items():
 
         _LOGGER.debug(f"Generating report for: {sli_name}")
 
         report_method = sli_report.report_sli_context[sli_name]["report_method"]
-        message += "\n" + report_method(metric_data)
+        message_parts.append("\n")
+        message_parts.append(report_method(html_inputs))
 
-    message += sli_report.report_references
+    message_parts.append(sli_report.report_references)
+    message_parts.append(sli_report.report_end)
 
-    message += sli_report.report_end
+    message = "".join(message_parts)
 
     html_message = MIMEText(message, "html")
     _LOGGER.debug(f"Email message: {html_message}")
 
-    html_file = open(Path.cwd().joinpath("thoth", "slo_reporter", "SLO-reporter.html"), "w")
-    html_file.write(message)
-    html_file.close()
+    if _DRY_RUN or _DEBUG_LEVEL:
+        with open(Path.cwd().joinpath("thoth", "slo_reporter", "SLO-reporter.html"), "w") as html_file:
+            html_file.write(message)
 
     if _DRY_RUN:
         return message
@@ -242,27 +288,30 @@ def send_sli_email(email_message: MIMEText, configuration: Configuration, sli_re
     msg["To"] = recipients
 
     msg.attach(email_message)
-    _MAIL_SERVER = smtplib.SMTP(server)
-    _MAIL_SERVER.sendmail(sender_address, recipients, msg.as_string())
+    with smtplib.SMTP(server) as mail_server:
+        mail_server.sendmail(sender_address, recipients, msg.as_string())
     _LOGGER.info(f"Thoth weekly SLI correctly sent.")
 
 
 def run_slo_reporter(
-    start_time: datetime.datetime, end_time: datetime.datetime, number_days: int, dry_run: bool, day_of_week: str,
+    configuration: Configuration, report_sli_context: Dict[str, Dict[str, Any]], day_of_week: str,
 ) -> None:
     """Run SLO reporter."""
-    configuration = Configuration(start_time=start_time, end_time=end_time, number_days=number_days, dry_run=dry_run)
-    sli_report = SLIReport(configuration=configuration)
+    sli_report = SLIReport(configuration=configuration, report_sli_context=report_sli_context)
 
-    # Collect metrics.
+    # Collect metrics, all queries share one pooled connection to Thanos.
+    pc = None
     if _DRY_RUN:
         _LOGGER.info("Dry run...")
-    weekly_sli_values_map = collect_metrics(configuration=configuration, sli_report=sli_report)
+    else:
+        pc = connect_to_thanos(configuration=configuration, pool_maxsize=max(_MAX_QUERY_WORKERS, 32))
+    weekly_sli_values_map = collect_metrics(configuration=configuration, sli_report=sli_report, pc=pc)
+    evaluated_sli_map = evaluate_metrics(sli_metrics=weekly_sli_values_map, sli_report=sli_report)
 
     # Store metrics on Ceph and push them to Pushgateway.
     if not _DRY_RUN:
         store_sli_weekly_metrics_to_ceph(
-            weekly_metrics=weekly_sli_values_map, configuration=configuration, sli_report=sli_report,
+            evaluated_metrics=evaluated_sli_map, configuration=configuration, sli_report=sli_report,
         )
 
         try:
@@ -272,7 +321,7 @@ def run_slo_reporter(
             pass
 
     if _DRY_RUN:
-        email_message = generate_email(weekly_sli_values_map, configuration=configuration, sli_report=sli_report)
+        email_message = generate_email(evaluated_sli_map, configuration=configuration, sli_report=sli_report)
         with tempfile.NamedTemporaryFile("w", delete=False, suffix=".html") as f:
             url = "file://" + f.name
             f.write(email_message)
@@ -283,7 +332,7 @@ def run_slo_reporter(
     if not _DRY_RUN and not _ONLY_STORE_ON_CEPH:
         if day_of_week == configuration.email_day:
             _LOGGER.info(f"Today is: {day_of_week}, therefore I send email.")
-            email_message = generate_email(weekly_sli_values_map, configuration=configuration, sli_report=sli_report)
+            email_message = generate_email(evaluated_sli_map, configuration=configuration, sli_report=sli_report)
             send_sli_email(email_message, configuration=configuration, sli_report=sli_report)
         else:
             _LOGGER.info(
@@ -308,6 +357,8 @@ def main():
             f" Otherwise {EVALUATION_METRICS_DAYS} emails will be sent out.",
         )
 
+    report_sli_context = None
+
     for i in range(0, EVALUATION_METRICS_DAYS):
         _END_TIME = datetime.datetime.utcnow() - datetime.timedelta(days=i)
         _START_TIME = _END_TIME - datetime.timedelta(days=INTERVAL_REPORT_DAYS)
@@ -315,14 +366,16 @@ def main():
 
         day_of_week = _END_TIME.strftime("%A")
 
-        run_slo_reporter(
-            start_time=_START_TIME,
-            end_time=_END_TIME,
-            number_days=INTERVAL_REPORT_DAYS,
-            dry_run=_DRY_RUN,
-            day_of_week=day_of_week,
+        configuration = Configuration(
+            start_time=_START_TIME, end_time=_END_TIME, number_days=INTERVAL_REPORT_DAYS, dry_run=_DRY_RUN,
         )
 
+        # SLI do not depend on the report dates, build them once for all days.
+        if report_sli_context is None:
+            report_sli_context = SLIReport.build_context(configuration=configuration)
+
+        run_slo_reporter(configuration=configuration, report_sli_context=report_sli_context, day_of_week=day_of_week)
+
 
 if __name__ == "__main__":
     main()
@@ -21,13 +21,32 @@ import logging
 import os
 import datetime
 
-from prometheus_client import CollectorRegistry, Gauge
+from prometheus_client import CollectorRegistry
+from prometheus_client.core import GaugeMetricFamily
 
-from typing import Optional
+from typing import Optional, Dict, List, Tuple, Iterator
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class SLIGaugeCollector:
+    """Collector exposing all SLI samples as a single gauge metric family."""
+
+    def __init__(self, name: str, documentation: str, labels: List[str]):
+        """Initialize SLI gauge collector."""
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.samples: Dict[Tuple[str, ...], float] = {}
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        """Collect all samples in one metric family."""
+        metric = GaugeMetricFamily(self.name, self.documentation, labels=self.labels)
+        for label_values, value in self.samples.items():
+            metric.add_metric(list(label_values), value)
+        yield metric
+
+
 class Configuration:
     """Configuration of SLO-reporter."""
 
@@ -68,12 +87,12 @@ class Configuration:
             self.pushgateway_endpoint = os.environ["PROMETHEUS_PUSHGATEWAY_URL"]
             self.prometheus_registry = CollectorRegistry()
 
-            self.thoth_weekly_sli = Gauge(
+            self.thoth_weekly_sli = SLIGaugeCollector(
                 f"thoth_sli_weekly_{self.environment}",
                 "Weekly Thoth Service Level Indicators",
                 ["sli_type", "metric_name"],
-                registry=self.prometheus_registry,
             )
+            self.prometheus_registry.register(self.thoth_weekly_sli)
 
             self.thanos_url = os.environ["THANOS_ENDPOINT"]
             self.thanos_token = os.environ["THANOS_ACCESS_TOKEN"]
@@ -21,7 +21,11 @@ from typing import Dict, List, Any
 
 
 class SLIBase:
-    """This class contain base functions that need to be created for SLI."""
+    """This class contain base functions that need to be created for SLI.
+
+    SLI instances are shared by the reports for all days evaluated in one run, therefore
+    `self.configuration` must not be used for date dependent values (e.g. start_time, end_time).
+    """
 
     _SLI_NAME = None
 
@@ -33,6 +37,10 @@ class SLIBase:
         """Aggregate queries for specific SLI Report."""
         raise NotImplementedError
 
+    def _build_queries(self) -> Dict[str, Any]:
+        """Build queries for specific SLI Report, called once when the SLI is initialized."""
+        raise NotImplementedError
+
     def _evaluate_sli(self, sli: Dict[str, Any]) -> Dict[str, float]:
         """Evaluate SLI for report for specific SLI.
 
@@ -40,9 +48,14 @@ class SLIBase:
         """
         raise NotImplementedError
 
-    def _report_sli(self, sli: Dict[str, Any]) -> str:
+    @staticmethod
+    def _all_metrics_failed(sli: Dict[str, Any]) -> bool:
+        """Check if none of the metrics for the SLI could be retrieved."""
+        return all(value == "ErrorMetricRetrieval" for value in sli.values())
+
+    def _report_sli(self, html_inputs: Dict[str, Any]) -> str:
         """Create report for specific SLI.
 
-        @param sli: It's a dict of SLI associated with the SLI type.
+        @param html_inputs: It's a dict of SLI evaluated with `_evaluate_sli`.
         """
         raise NotImplementedError
@@ -17,12 +17,13 @@
 
 """This file contains class for Kebechet."""
 
+import copy
 import logging
 import os
 
 import numpy as np
 
-from typing import Dict, List, Any
+from typing import Dict, Any
 
 from .sli_base import SLIBase
 from .sli_template import HTMLTemplates
@@ -35,6 +36,11 @@ _REGISTERED_KEBECHET_QUANTITY = {
     "delta_total_active_repositories": "Change in active repositories since last week",
 }
 
+_ALL_NAN_HTML_INPUTS = {
+    knowledge_quantity: {"name": name, "value": np.nan}
+    for knowledge_quantity, name in _REGISTERED_KEBECHET_QUANTITY.items()
+}
+
 
 class SLIKebechet(SLIBase):
     """This class contain functions for Kebechet SLI."""
@@ -50,12 +56,18 @@ class SLIKebechet(SLIBase):
         else:
             self.instance = os.environ["PROMETHEUS_INSTANCE_METRICS_EXPORTER_FRONTEND"]
 
+        self._queries = self._build_queries()
+
     def _aggregate_info(self):
         """Aggregate info required for Kebechet SLI Report."""
         return {"query": self._query_sli(), "evaluation_method": self._evaluate_sli, "report_method": self._report_sli}
 
-    def _query_sli(self) -> List[str]:
+    def _query_sli(self) -> Dict[str, Any]:
         """Aggregate queries for Kebechet SLI Report."""
+        return self._queries
+
+    def _build_queries(self) -> Dict[str, Any]:
+        """Build queries for Kebechet SLI Report."""
         query_labels = f'{{instance="{self.instance}", job="Thoth Metrics ({self.configuration.environment})"}}'
         return {
             "total_active_repositories": {
@@ -75,6 +87,9 @@ class SLIKebechet(SLIBase):
 
         @param sli: It's a dict of SLI associated with the SLI type.
         """
+        if self._all_metrics_failed(sli=sli):
+            return copy.deepcopy(_ALL_NAN_HTML_INPUTS)
+
         html_inputs = {}
 
         for knowledge_quantity in _REGISTERED_KEBECHET_QUANTITY.keys():
@@ -88,12 +103,11 @@ class SLIKebechet(SLIBase):
 
         return html_inputs
 
-    def _report_sli(self, sli: Dict[str, Any]) -> str:
+    def _report_sli(self, html_inputs: Dict[str, Any]) -> str:
         """Create report for Kebechet SLI.
 
-        @param sli: It's a dict of SLI associated with the SLI type.
+        @param html_inputs: It's a dict of SLI evaluated with `_evaluate_sli`.
         """
-        html_inputs = self._evaluate_sli(sli=sli)
         report = HTMLTemplates.thoth_kebechet_template(html_inputs=html_inputs)
 
         return report
@@ -17,12 +17,13 @@
 
 """This file contains class for Thoth Knowledge Graph."""
 
+import copy
 import logging
 import os
 
 import numpy as np
 
-from typing import Dict, List, Any
+from typing import Dict, Any
 
 from .sli_base import SLIBase
 from .sli_template import HTMLTemplates
@@ -39,6 +40,11 @@ _REGISTERED_KNOWLEDGE_QUANTITY = {
     "new_packages_releases": "New Python Packages Releases",
 }
 
+_ALL_NAN_HTML_INPUTS = {
+    knowledge_quantity: {"name": name, "value": np.nan}
+    for knowledge_quantity, name in _REGISTERED_KNOWLEDGE_QUANTITY.items()
+}
+
 
 class SLIKnowledgeGraph(SLIBase):
     """This class contain functions for Knowledge Graph SLI."""
@@ -54,12 +60,18 @@ class SLIKnowledgeGraph(SLIBase):
         else:
             self.instance = os.environ["PROMETHEUS_INSTANCE_METRICS_EXPORTER_FRONTEND"]
 
+        self._queries = self._build_queries()
+
     def _aggregate_info(self):
         """Aggregate info required for knowledge graph SLI Report."""
         return {"query": self._query_sli(), "evaluation_method": self._evaluate_sli, "report_method": self._report_sli}
 
-    def _query_sli(self) -> List[str]:
+    def _query_sli(self) -> Dict[str, Any]:
         """Aggregate queries for knowledge graph SLI Report."""
+        return self._queries
+
+    def _build_queries(self) -> Dict[str, Any]:
+        """Build queries for knowledge graph SLI Report."""
         query_labels = f'{{instance="{self.instance}", job="Thoth Metrics ({self.configuration.environment})"}}'
 
         return {
@@ -95,6 +107,9 @@ class SLIKnowledgeGraph(SLIBase):
 
         @param sli: It's a dict of SLI associated with the SLI type.
         """
+        if self._all_metrics_failed(sli=sli):
+            return copy.deepcopy(_ALL_NAN_HTML_INPUTS)
+
         html_inputs = {}
 
         for knowledge_quantity in _REGISTERED_KNOWLEDGE_QUANTITY.keys():
@@ -110,12 +125,10 @@ class SLIKnowledgeGraph(SLIBase):
 
         return html_inputs
 
-    def _report_sli(self, sli: Dict[str, Any]) -> str:
+    def _report_sli(self, html_inputs: Dict[str, Any]) -> str:
         """Create report for knowledge graph SLI.
 
-        @param sli: It's a dict of SLI associated with the SLI type.
+        @param html_inputs: It's a dict of SLI evaluated with `_evaluate_sli`.
         """
-        html_inputs = self._evaluate_sli(sli=sli)
-
         report = HTMLTemplates.thoth_knowledge_template(html_inputs=html_inputs)
         return report
@@ -17,12 +17,13 @@
 
 """This file contains class for Learning Quantities about Thoth."""
 
+import copy
 import logging
 import os
 
 import numpy as np
 
-from typing import Dict, List, Any
+from typing import Dict, Any
 
 from .sli_base import SLIBase
 from .sli_template import HTMLTemplates
@@ -37,6 +38,11 @@ _REGISTERED_LEARNING_MEASUREMENT_UNIT = {
     "new_solvers": {"name": "New Solvers", "measurement_unit": ""},
 }
 
+_ALL_NAN_HTML_INPUTS = {
+    learning_quantity: {"value": np.nan, "name": data["name"], "measurement_unit": data["measurement_unit"]}
+    for learning_quantity, data in _REGISTERED_LEARNING_MEASUREMENT_UNIT.items()
+}
+
 _LEARNING_RATE_INTERVAL = "2h"
 
 
@@ -54,12 +60,18 @@ class SLILearning(SLIBase):
         else:
             self.instance = os.environ["PROMETHEUS_INSTANCE_METRICS_EXPORTER_FRONTEND"]
 
+        self._queries = self._build_queries()
+
     def _aggregate_info(self):
         """Aggregate info required for learning quantities SLI Report."""
         return {"query": self._query_sli(), "evaluation_method": self._evaluate_sli, "report_method": self._report_sli}
 
-    def _query_sli(self) -> List[str]:
+    def _query_sli(self) -> Dict[str, Any]:
         """Aggregate queries for learning quantities SLI Report."""
+        return self._queries
+
+    def _build_queries(self) -> Dict[str, Any]:
+        """Build queries for learning quantities SLI Report."""
         query_labels = f'{{instance="{self.instance}", job="Thoth Metrics ({self.configuration.environment})"}}'
 
         return {
@@ -92,6 +104,9 @@ class SLILearning(SLIBase):
 
         @param sli: It's a dict of SLI associated with the SLI type.
         """
+        if self._all_metrics_failed(sli=sli):
+            return copy.deepcopy(_ALL_NAN_HTML_INPUTS)
+
         html_inputs = {}
 
         for learning_quantity in _REGISTERED_LEARNING_MEASUREMENT_UNIT.keys():
@@ -114,12 +129,10 @@ class SLILearning(SLIBase):
 
         return html_inputs
 
-    def _report_sli(self, sli: Dict[str, Any]) -> str:
+    def _report_sli(self, html_inputs: Dict[str, Any]) -> str:
         """Create report for learning quantities SLI.
 
-        @param sli: It's a dict of SLI associated with the SLI type.
+        @param html_inputs: It's a dict of SLI evaluated with `_evaluate_sli`.
         """
-        html_inputs = self._evaluate_sli(sli=sli)
-
         report = HTMLTemplates.thoth_learning_template(html_inputs=html_inputs)
         return report
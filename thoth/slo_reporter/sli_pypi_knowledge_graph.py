@@ -17,12 +17,13 @@
 
 """This file contains class for PyPI Knowledge Graph."""
 
+import copy
 import logging
 import os
 
 import numpy as np
 
-from typing import Dict, List, Any
+from typing import Dict, Any
 
 from .sli_base import SLIBase
 from .sli_template import HTMLTemplates
@@ -38,6 +39,11 @@ _REGISTERED_KNOWLEDGE_QUANTITY = {
     "new_packages_releases": "New Python Packages Releases",
 }
 
+_ALL_NAN_HTML_INPUTS = {
+    knowledge_quantity: {"name": name, "value": np.nan}
+    for knowledge_quantity, name in _REGISTERED_KNOWLEDGE_QUANTITY.items()
+}
+
 
 class SLIPyPIKnowledgeGraph(SLIBase):
     """This class contain functions for PyPI Knowledge Graph SLI."""
@@ -53,12 +59,18 @@ class SLIPyPIKnowledgeGraph(SLIBase):
         else:
             self.instance = os.environ["PROMETHEUS_INSTANCE_METRICS_EXPORTER_FRONTEND"]
 
+        self._queries = self._build_queries()
+
     def _aggregate_info(self):
         """Aggregate info required for knowledge graph SLI Report."""
         return {"query": self._query_sli(), "evaluation_method": self._evaluate_sli, "report_method": self._report_sli}
 
-    def _query_sli(self) -> List[str]:
+    def _query_sli(self) -> Dict[str, Any]:
         """Aggregate queries for knowledge graph SLI Report."""
+        return self._queries
+
+    def _build_queries(self) -> Dict[str, Any]:
+        """Build queries for knowledge graph SLI Report."""
         query_labels_packages = f'{{instance="{self.instance}", job="Thoth Metrics ({self.configuration.environment})", stats_type="packages"}}'
         query_labels_releases = f'{{instance="{self.instance}", job="Thoth Metrics ({self.configuration.environment})", stats_type="releases"}}'
 
@@ -90,6 +102,9 @@ class SLIPyPIKnowledgeGraph(SLIBase):
 
         @param sli: It's a dict of SLI associated with the SLI type.
         """
+        if self._all_metrics_failed(sli=sli):
+            return copy.deepcopy(_ALL_NAN_HTML_INPUTS)
+
         html_inputs = {}
 
         for knowledge_quantity in _REGISTERED_KNOWLEDGE_QUANTITY.keys():
@@ -104,12 +119,10 @@ class SLIPyPIKnowledgeGraph(SLIBase):
 
         return html_inputs
 
-    def _report_sli(self, sli: Dict[str, Any]) -> str:
+    def _report_sli(self, html_inputs: Dict[str, Any]) -> str:
         """Create report for PyPI knowledge graph SLI.
 
-        @param sli: It's a dict of SLI associated with the SLI type.
+        @param html_inputs: It's a dict of SLI evaluated with `_evaluate_sli`.
         """
-        html_inputs = self._evaluate_sli(sli=sli)
-
         report = HTMLTemplates.thoth_pypi_knowledge_template(html_inputs=html_inputs)
         return report
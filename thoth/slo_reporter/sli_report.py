@@ -20,6 +20,8 @@
 import os
 import logging
 
+from typing import Dict, Any, Optional
+
 from .configuration import Configuration
 
 from .sli_references import _add_dashbords
@@ -35,12 +37,26 @@ from .sli_template import HTMLTemplates
 
 _LOGGER = logging.getLogger(__name__)
 
+# The order of the classes is the order in which the report is populated.
+_SLI_CLASSES = [
+    SLIPyPIKnowledgeGraph,
+    SLIKnowledgeGraph,
+    SLILearning,
+    SLIKebechet,
+    SLIUserAPI,
+    SLIWorkflowQuality,
+    SLIWorkflowLatency,
+]
+
 
 class SLIReport:
     """This class contains all sections included in a report."""
 
-    def __init__(self, configuration: Configuration):
-        """Initialize SLI Report."""
+    def __init__(self, configuration: Configuration, report_sli_context: Optional[Dict[str, Dict[str, Any]]] = None):
+        """Initialize SLI Report.
+
+        @param report_sli_context: SLI context created with `build_context`, it is built if not provided.
+        """
         self.configuration = configuration
 
         self.report_subject = (
@@ -60,16 +76,22 @@ class SLIReport:
 
         self.report_style = HTMLTemplates.thoth_report_style_template()
 
-        self.report_sli_context = {
-            SLIPyPIKnowledgeGraph._SLI_NAME: SLIPyPIKnowledgeGraph(configuration=self.configuration)._aggregate_info(),
-            SLIKnowledgeGraph._SLI_NAME: SLIKnowledgeGraph(configuration=self.configuration)._aggregate_info(),
-            SLILearning._SLI_NAME: SLILearning(configuration=self.configuration)._aggregate_info(),
-            SLIKebechet._SLI_NAME: SLIKebechet(configuration=self.configuration)._aggregate_info(),
-            SLIUserAPI._SLI_NAME: SLIUserAPI(configuration=self.configuration)._aggregate_info(),
-            SLIWorkflowQuality._SLI_NAME: SLIWorkflowQuality(configuration=self.configuration)._aggregate_info(),
-            SLIWorkflowLatency._SLI_NAME: SLIWorkflowLatency(configuration=self.configuration)._aggregate_info(),
-        }
+        if report_sli_context is None:
+            report_sli_context = self.build_context(configuration=self.configuration)
+
+        self.report_sli_context = report_sli_context
 
         self.report_references = _add_dashbords(configuration=configuration)
 
         self.report_end = HTMLTemplates.thoth_report_end_template()
+
+    @classmethod
+    def build_context(cls, configuration: Configuration) -> Dict[str, Dict[str, Any]]:
+        """Build queries, evaluation and report methods for all SLI.
+
+        SLI do not depend on the report interval dates, therefore the context can be shared
+        by reports for different days using the same environment and interval.
+        """
+        return {
+            sli_class._SLI_NAME: sli_class(configuration=configuration)._aggregate_info() for sli_class in _SLI_CLASSES
+        }
@@ -17,13 +17,14 @@
 
 """This file contains class for Thoth User-API."""
 
+import copy
 import logging
 import os
 import datetime
 
 import numpy as np
 
-from typing import Dict, List, Any
+from typing import Dict, Any
 
 from .sli_base import SLIBase
 from .sli_template import HTMLTemplates
@@ -41,6 +42,11 @@ _USER_API_MEASUREMENT_UNIT = {
     "avg_up_time": {"name": "Uptime User-API (avg)", "measurement_unit": "%"},
 }
 
+_ALL_NAN_HTML_INPUTS = {
+    user_api_quantity: {"value": np.nan, "name": data["name"], "measurement_unit": data["measurement_unit"]}
+    for user_api_quantity, data in _USER_API_MEASUREMENT_UNIT.items()
+}
+
 
 class SLIUserAPI(SLIBase):
     """This class contains functions for User-API SLI."""
@@ -56,12 +62,18 @@ class SLIUserAPI(SLIBase):
         else:
             self.instance = os.environ["PROMETHEUS_INSTANCE_USER_API"]
 
+        self._queries = self._build_queries()
+
     def _aggregate_info(self):
         """Aggregate info required for User-API SLI Report."""
         return {"query": self._query_sli(), "evaluation_method": self._evaluate_sli, "report_method": self._report_sli}
 
-    def _query_sli(self) -> List[str]:
+    def _query_sli(self) -> Dict[str, Any]:
         """Aggregate queries for User-API SLI Report."""
+        return self._queries
+
+    def _build_queries(self) -> Dict[str, Any]:
+        """Build queries for User-API SLI Report."""
         query_labels = f'{{instance="{self.instance}"}}'
         query_labels_success = f'{{instance="{self.instance}", status=~"2.*"}}'
         query_labels_up = (
@@ -87,6 +99,9 @@ class SLIUserAPI(SLIBase):
 
         @param sli: It's a dict of SLI associated with the SLI type.
         """
+        if self._all_metrics_failed(sli=sli):
+            return copy.deepcopy(_ALL_NAN_HTML_INPUTS)
+
         html_inputs = {}
 
         for user_api_quantity in _USER_API_MEASUREMENT_UNIT.keys():
@@ -101,7 +116,7 @@ class SLIUserAPI(SLIBase):
                     else:
                         results[quantity] = np.nan
 
-                if all(single_quantity != np.nan for single_quantity in results.values()):
+                if not any(np.isnan(single_quantity) for single_quantity in results.values()):
                     if results["avg_total_request"] > 0:
                         percentage = results["avg_successfull_request"] / results["avg_total_request"]
                     else:
@@ -122,12 +137,10 @@ class SLIUserAPI(SLIBase):
 
         return html_inputs
 
-    def _report_sli(self, sli: Dict[str, Any]) -> str:
+    def _report_sli(self, html_inputs: Dict[str, Any]) -> str:
         """Create report for User-API SLI.
 
-        @param sli: It's a dict of SLI associated with the SLI type.
+        @param html_inputs: It's a dict of SLI evaluated with `_evaluate_sli`.
         """
-        html_inputs = self._evaluate_sli(sli=sli)
-
         report = HTMLTemplates.thoth_user_api_template(html_inputs=html_inputs)
         return report
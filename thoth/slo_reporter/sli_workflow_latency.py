@@ -17,13 +17,14 @@
 
 """This file contains class for Workflow Latency SLI."""
 
+import copy
 import logging
 import os
 import datetime
 
 import numpy as np
 
-from typing import Dict, List, Any
+from typing import Dict, Any
 
 from .sli_base import SLIBase
 from .sli_template import HTMLTemplates
@@ -46,12 +47,22 @@ class SLIWorkflowLatency(SLIBase):
         else:
             self.instance = os.environ["PROMETHEUS_INSTANCE_METRICS_EXPORTER_FRONTEND"]
 
+        self._queries = self._build_queries()
+        self._all_nan_html_inputs = {
+            service: {"minutes": np.nan, "seconds": np.nan, "value": np.nan}
+            for service in self.configuration.registered_services
+        }
+
     def _aggregate_info(self):
         """Aggregate info required for component_latency SLI Report."""
         return {"query": self._query_sli(), "evaluation_method": self._evaluate_sli, "report_method": self._report_sli}
 
-    def _query_sli(self) -> List[str]:
+    def _query_sli(self) -> Dict[str, Any]:
         """Aggregate queries for component_latency SLI Report."""
+        return self._queries
+
+    def _build_queries(self) -> Dict[str, Any]:
+        """Build queries for component_latency SLI Report."""
         queries = {}
         for service in self.configuration.registered_services:
             result = self._aggregate_queries(service=service)
@@ -83,6 +94,9 @@ class SLIWorkflowLatency(SLIBase):
 
         @param sli: It's a dict of SLI associated with the SLI type.
         """
+        if self._all_metrics_failed(sli=sli):
+            return copy.deepcopy(self._all_nan_html_inputs)
+
         html_inputs = {}
 
         for service in self.configuration.registered_services:
@@ -102,13 +116,11 @@ class SLIWorkflowLatency(SLIBase):
 
         return html_inputs
 
-    def _report_sli(self, sli: Dict[str, Any]) -> str:
+    def _report_sli(self, html_inputs: Dict[str, Any]) -> str:
         """Create report for component_latency SLI.
 
-        @param sli: It's a dict of SLI associated with the SLI type.
+        @param html_inputs: It's a dict of SLI evaluated with `_evaluate_sli`.
         """
-        html_inputs = self._evaluate_sli(sli=sli)
-
         report = HTMLTemplates.thoth_services_latency_template(html_inputs=html_inputs)
 
         return report
@@ -18,21 +18,27 @@
 """Collection of methods used in SLO-reporter."""
 
 import logging
-import statistics
+import functools
 
-import pandas as pd
+import numpy as np
 
-from typing import List, Dict, Optional
+from typing import Optional, TYPE_CHECKING
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from thoth.storages import CephStore
 
 from thoth.slo_reporter.configuration import _get_sli_metrics_prefix, Configuration
 
 
+if TYPE_CHECKING:
+    import pandas as pd
+    from prometheus_api_client import PrometheusConnect
+
 _LOGGER = logging.getLogger(__name__)
 
 
-def manipulate_retrieved_metrics_vector(metrics_vector: List[float], action: str) -> float:
+def manipulate_retrieved_metrics_vector(metrics_vector: np.ndarray, action: str) -> float:
     """Manipulate metrics vector obtained from Prometheus/Thanos depending on the requested result type.
 
     :parameter: metrics_vector: metrics vector
@@ -45,63 +51,75 @@ def manipulate_retrieved_metrics_vector(metrics_vector: List[float], action: str
 
     :output: metric/SLI
     """
+    metrics_vector = np.asarray(metrics_vector, dtype=np.float64)
+
     # Make sure 0 results are not considered
-    if not metrics_vector:
+    if not metrics_vector.size:
         metric = 0
         return metric
 
     if action == "min_max":
-        metric = max(metrics_vector) - min(metrics_vector)
+        metric = metrics_vector.max() - metrics_vector.min()
 
     elif action == "delta":
-        modified_results = _evaluate_ascending_results(metrics_vector=metrics_vector)
         metric = metrics_vector[-1] - metrics_vector[0]
 
     elif action == "min_max_only_ascending":
         modified_results = _evaluate_ascending_results(metrics_vector=metrics_vector)
-        metric = max(modified_results) - min(modified_results)
+        metric = modified_results.max() - modified_results.min()
 
     elif action == "average":
-        metric = statistics.mean(metrics_vector)
+        metric = metrics_vector.mean()
 
     elif action == "latest":
         metric = metrics_vector[-1]
 
-    return metric
-
-
-def _evaluate_ascending_results(metrics_vector: List[float]) -> List[float]:
-    """Evaluate vector with only ascending values."""
-    counter = 0
-    modified_vector = []
-
-    for retrieved_value in metrics_vector:
-        if counter == 0:
-            modified_vector.append(retrieved_value)
-
-        else:
+    return float(metric)
 
-            if retrieved_value > metrics_vector[counter - 1]:
-                modified_vector.append(retrieved_value)
 
-            else:
-                pass
+def _evaluate_ascending_results(metrics_vector: np.ndarray) -> np.ndarray:
+    """Evaluate vector with only ascending values.
 
-        counter += 1
-
-    return modified_vector
+    The first value is always kept, any following value is kept only if greater than the previous one.
+    """
+    ascending = np.empty(metrics_vector.size, dtype=bool)
+    ascending[0] = True
+    np.greater(metrics_vector[1:], metrics_vector[:-1], out=ascending[1:])
+    return metrics_vector[ascending]
 
 
+@functools.lru_cache(maxsize=8)
 def connect_to_ceph(ceph_bucket_prefix: str, environment: str, bucket: Optional[str] = None) -> CephStore:
-    """Connect to Ceph to store SLI metrics for Thoth."""
+    """Connect to Ceph to store SLI metrics for Thoth.
+
+    Connections are cached, so the same client is reused for every report within one run.
+    """
     prefix = _get_sli_metrics_prefix(ceph_bucket_prefix=ceph_bucket_prefix, environment=environment)
     ceph = CephStore(prefix=prefix, bucket=bucket)
     ceph.connect()
     return ceph
 
 
+def connect_to_thanos(configuration: Configuration, pool_maxsize: int = 32) -> "PrometheusConnect":
+    """Connect to Thanos reusing persistent (keep-alive) connections for all queries."""
+    # prometheus_api_client imports pandas, import it only when Thanos is queried.
+    from prometheus_api_client import PrometheusConnect
+
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+    pc = PrometheusConnect(
+        url=configuration.thanos_url,
+        headers={"Authorization": f"bearer {configuration.thanos_token}"},
+        disable_ssl=True,
+        retry=retry,
+    )
+    # PrometheusConnect mounts its own adapter (default pool of 10) on its url and requests picks
+    # the adapter with the longest matching prefix, so the pooled adapter has to replace it there.
+    pc._session.mount(pc.url, HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=retry))
+    return pc
+
+
 def store_thoth_sli_on_ceph(
-    ceph_sli: CephStore, metric_class: str, metrics_df: pd.DataFrame, ceph_path: str, is_public: bool = False,
+    ceph_sli: CephStore, metric_class: str, metrics_df: "pd.DataFrame", ceph_path: str, is_public: bool = False,
 ) -> None:
     """Store Thoth SLI on Ceph."""
     metrics_csv = metrics_df.to_csv(index=False, header=False)